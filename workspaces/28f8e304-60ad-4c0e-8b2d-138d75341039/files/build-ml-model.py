@@ -4,18 +4,27 @@ import pandas as pd
 import numpy as np
 from scipy.sparse import csr_matrix
 from scipy.spatial.distance import cosine
-from sklearn.decomposition import TruncatedSVD, NMF
+from sklearn.decomposition import NMF
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error
 import pickle
 import logging
+import os
 from typing import List, Dict, Tuple, Optional
 import json
 from datetime import datetime
 import redis
 import hashlib
+from numba import njit, prange
+
+# Optional GPU backend for content-based scoring on very large catalogs
+try:
+    import cupy
+    import cupyx.scipy.sparse
+except ImportError:
+    cupy = None
 
 class DataProcessor:
     """Handles data preprocessing and feature engineering for recommendation system"""
@@ -36,28 +45,25 @@ class DataProcessor:
         interactions_df = interactions_df.drop_duplicates(['user_id', 'item_id']).copy()
         
         # Filter users and items with minimum interactions
-        user_counts = interactions_df['user_id'].value_counts()
-        item_counts = interactions_df['item_id'].value_counts()
-        
-        valid_users = user_counts[user_counts >= self.min_interactions].index
-        valid_items = item_counts[item_counts >= self.min_interactions].index
+        user_counts = interactions_df.groupby('user_id')['user_id'].transform('size')
+        item_counts = interactions_df.groupby('item_id')['item_id'].transform('size')
         
         interactions_df = interactions_df[
-            (interactions_df['user_id'].isin(valid_users)) & 
-            (interactions_df['item_id'].isin(valid_items))
+            (user_counts >= self.min_interactions) & 
+            (item_counts >= self.min_interactions)
         ]
         
-        # Encode user and item IDs
-        unique_users = interactions_df['user_id'].unique()
-        unique_items = interactions_df['item_id'].unique()
+        # Encode user and item IDs via C-level factorization
+        user_cat = pd.Categorical(interactions_df['user_id'])
+        item_cat = pd.Categorical(interactions_df['item_id'])
         
-        self.user_encoder = {user: idx for idx, user in enumerate(unique_users)}
-        self.item_encoder = {item: idx for idx, item in enumerate(unique_items)}
-        self.user_decoder = {idx: user for user, idx in self.user_encoder.items()}
-        self.item_decoder = {idx: item for item, idx in self.item_encoder.items()}
+        self.user_encoder = dict(zip(user_cat.categories, range(len(user_cat.categories))))
+        self.item_encoder = dict(zip(item_cat.categories, range(len(item_cat.categories))))
+        self.user_decoder = dict(enumerate(user_cat.categories))
+        self.item_decoder = dict(enumerate(item_cat.categories))
         
-        interactions_df['user_idx'] = interactions_df['user_id'].map(self.user_encoder)
-        interactions_df['item_idx'] = interactions_df['item_id'].map(self.item_encoder)
+        interactions_df['user_idx'] = user_cat.codes.astype(np.int32)
+        interactions_df['item_idx'] = item_cat.codes.astype(np.int32)
         
         return interactions_df
     
@@ -67,26 +73,69 @@ class DataProcessor:
         n_users = len(self.user_encoder)
         n_items = len(self.item_encoder)
         
-        # Handle implicit feedback (no ratings)
-        if rating_col not in interactions_df.columns:
-            interactions_df[rating_col] = 1.0
+        # Handle implicit feedback (no ratings) without writing a column into the caller's frame
+        if rating_col in interactions_df.columns:
+            data = np.asarray(interactions_df[rating_col].values, dtype=np.float32)
+        else:
+            data = np.ones(len(interactions_df), dtype=np.float32)
+        rows = np.asarray(interactions_df['user_idx'].values, dtype=np.int32)
+        cols = np.asarray(interactions_df['item_idx'].values, dtype=np.int32)
         
-        # Create sparse matrix
+        # Create sparse matrix (float32 halves memory traffic for every later sparse op)
         interaction_matrix = csr_matrix(
-            (interactions_df[rating_col].values,
-             (interactions_df['user_idx'].values, interactions_df['item_idx'].values)),
-            shape=(n_users, n_items)
+            (data, (rows, cols)),
+            shape=(n_users, n_items), dtype=np.float32
         )
         
         return interaction_matrix
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _sgd_epoch(users, items, ratings, P, Q, bu, bi, mu, lr, reg):
+    """Run one Funk-SVD SGD epoch over the observed (user, item, rating) triplets.
+    
+    Updates P, Q, bu and bi in place. Parallel updates are lock-free (Hogwild-style);
+    collisions on shared rows are rare on sparse data and do not hurt convergence.
+    """
+    n_factors = P.shape[1]
+    for idx in prange(len(users)):
+        u = users[idx]
+        i = items[idx]
+        
+        pred = mu + bu[u] + bi[i]
+        for k in range(n_factors):
+            pred += P[u, k] * Q[i, k]
+        err = ratings[idx] - pred
+        
+        bu[u] += lr * (err - reg * bu[u])
+        bi[i] += lr * (err - reg * bi[i])
+        for k in range(n_factors):
+            p_uk = P[u, k]
+            q_ik = Q[i, k]
+            P[u, k] += lr * (err * q_ik - reg * p_uk)
+            Q[i, k] += lr * (err * p_uk - reg * q_ik)
+
+@njit(fastmath=True, cache=True)
+def _predict(u, i, P, Q, bu, bi, mu, lo, hi):
+    """Predict a single clamped rating; falls back to the global mean for unknown indices"""
+    if u >= P.shape[0] or i >= Q.shape[0]:
+        return mu
+    
+    s = mu + bu[u] + bi[i]
+    for k in range(P.shape[1]):
+        s += P[u, k] * Q[i, k]
+    return min(hi, max(lo, s))
+
 class CollaborativeFilteringModel:
     """Implements collaborative filtering using matrix factorization"""
     
-    def __init__(self, n_components: int = 50, random_state: int = 42):
+    def __init__(self, n_components: int = 50, random_state: int = 42,
+                 n_epochs: int = 20, learning_rate: float = 0.005,
+                 regularization: float = 0.02):
         self.n_components = n_components
         self.random_state = random_state
-        self.svd_model = None
+        self.n_epochs = n_epochs
+        self.learning_rate = learning_rate
+        self.regularization = regularization
         self.user_factors = None
         self.item_factors = None
         self.global_mean = None
@@ -94,38 +143,94 @@ class CollaborativeFilteringModel:
         self.item_biases = None
         
     def fit(self, interaction_matrix: csr_matrix):
-        """Train collaborative filtering model using SVD"""
+        """Train collaborative filtering model using biased Funk-SVD on observed entries"""
         # Calculate global mean and biases
         self.global_mean = interaction_matrix.data.mean()
         
-        # User and item biases
-        user_sums = np.array(interaction_matrix.sum(axis=1)).flatten()
-        user_counts = np.array((interaction_matrix > 0).sum(axis=1)).flatten()
+        # User and item biases, read straight off the CSR structure (no boolean copy)
+        n_users, n_items = interaction_matrix.shape
+        data = interaction_matrix.data.astype(np.float64, copy=False)
+        user_counts = np.diff(interaction_matrix.indptr).astype(np.float64)
+        row_idx = np.repeat(np.arange(n_users), np.diff(interaction_matrix.indptr))
+        user_sums = np.bincount(row_idx, weights=data, minlength=n_users)
         self.user_biases = np.divide(user_sums, user_counts, 
                                    out=np.zeros_like(user_sums), where=user_counts!=0) - self.global_mean
         
-        item_sums = np.array(interaction_matrix.sum(axis=0)).flatten()
-        item_counts = np.array((interaction_matrix > 0).sum(axis=0)).flatten()
+        item_sums = np.bincount(interaction_matrix.indices, weights=data, minlength=n_items)
+        item_counts = np.bincount(interaction_matrix.indices, minlength=n_items).astype(np.float64)
         self.item_biases = np.divide(item_sums, item_counts,
                                    out=np.zeros_like(item_sums), where=item_counts!=0) - self.global_mean
         
-        # Apply SVD
-        self.svd_model = TruncatedSVD(n_components=self.n_components, 
-                                     random_state=self.random_state)
-        self.user_factors = self.svd_model.fit_transform(interaction_matrix)
-        self.item_factors = self.svd_model.components_.T
+        # Extract observed triplets; SGD only ever touches these, never the zeros
+        coo = interaction_matrix.tocoo()
+        rng = np.random.default_rng(self.random_state)
+        order = rng.permutation(coo.nnz)
+        users = np.ascontiguousarray(coo.row[order], dtype=np.int32)
+        items = np.ascontiguousarray(coo.col[order], dtype=np.int32)
+        ratings = np.ascontiguousarray(coo.data[order], dtype=np.float32)
+        
+        P = rng.normal(0, 0.1, (n_users, self.n_components)).astype(np.float32)
+        Q = rng.normal(0, 0.1, (n_items, self.n_components)).astype(np.float32)
+        bu = self.user_biases.astype(np.float32)
+        bi = self.item_biases.astype(np.float32)
+        mu = np.float32(self.global_mean)
+        lr = np.float32(self.learning_rate)
+        reg = np.float32(self.regularization)
+        
+        for _ in range(self.n_epochs):
+            _sgd_epoch(users, items, ratings, P, Q, bu, bi, mu, lr, reg)
+        
+        # Keep everything float32: scoring is bound by factor-matrix bandwidth
+        self.global_mean = mu
+        self.user_factors = np.ascontiguousarray(P, dtype=np.float32)
+        self.item_factors = np.ascontiguousarray(Q, dtype=np.float32)
+        self.user_biases = bu.astype(np.float32, copy=False)
+        self.item_biases = bi.astype(np.float32, copy=False)
+    
+    @property
+    def item_factors_T(self) -> np.ndarray:
+        """(k, n_items) view of item_factors; BLAS consumes the transpose flag, no copy"""
+        return self.item_factors.T
+    
+    # Arrays persisted as .npy so they can be memory-mapped and shared across workers
+    _PERSISTED_ARRAYS = ('user_factors', 'item_factors', 'user_biases', 'item_biases')
+    
+    def save(self, path: str):
+        """Save factors and biases as .npy files with a JSON sidecar for scalars"""
+        os.makedirs(path, exist_ok=True)
+        for name in self._PERSISTED_ARRAYS:
+            np.save(os.path.join(path, f"{name}.npy"), getattr(self, name))
+        
+        meta = {
+            'n_components': self.n_components,
+            'random_state': self.random_state,
+            'n_epochs': self.n_epochs,
+            'learning_rate': self.learning_rate,
+            'regularization': self.regularization,
+            'global_mean': float(self.global_mean),
+        }
+        with open(os.path.join(path, 'meta.json'), 'w') as f:
+            json.dump(meta, f)
+    
+    @classmethod
+    def load(cls, path: str, mmap_mode: Optional[str] = 'r') -> 'CollaborativeFilteringModel':
+        """Load a saved model; arrays are memory-mapped read-only by default"""
+        with open(os.path.join(path, 'meta.json')) as f:
+            meta = json.load(f)
+        
+        global_mean = meta.pop('global_mean')
+        model = cls(**meta)
+        model.global_mean = np.float32(global_mean)
+        for name in cls._PERSISTED_ARRAYS:
+            setattr(model, name, np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode))
+        
+        return model
         
     def predict(self, user_idx: int, item_idx: int) -> float:
         """Predict rating for user-item pair"""
-        if user_idx >= len(self.user_factors) or item_idx >= len(self.item_factors):
-            return self.global_mean
-        
-        prediction = (self.global_mean + 
-                     self.user_biases[user_idx] + 
-                     self.item_biases[item_idx] +
-                     np.dot(self.user_factors[user_idx], self.item_factors[item_idx]))
-        
-        return max(0, min(5, prediction))  # Clamp between 0-5
+        return float(_predict(user_idx, item_idx, self.user_factors, self.item_factors,
+                              self.user_biases, self.item_biases, self.global_mean,
+                              0.0, 5.0))  # Clamp between 0-5
     
     def get_user_recommendations(self, user_idx: int, n_recommendations: int = 10,
                                exclude_seen: set = None) -> List[Tuple[int, float]]:
@@ -138,32 +243,93 @@ class CollaborativeFilteringModel:
         
         # Calculate scores for all items
         user_vector = self.user_factors[user_idx]
-        scores = np.dot(self.item_factors, user_vector)
+        scores = user_vector @ self.item_factors_T
         scores += self.item_biases
         scores += self.user_biases[user_idx] + self.global_mean
         
-        # Get top recommendations excluding seen items
-        item_scores = [(idx, score) for idx, score in enumerate(scores) 
-                      if idx not in exclude_seen]
-        item_scores.sort(key=lambda x: x[1], reverse=True)
+        # Mask out seen items, then partition for the top-k and sort only those
+        if exclude_seen:
+            seen = np.fromiter(exclude_seen, dtype=np.int64, count=len(exclude_seen))
+            scores[seen] = -np.inf
         
-        return item_scores[:n_recommendations]
+        n_recommendations = min(n_recommendations, len(scores) - len(exclude_seen))
+        if n_recommendations <= 0:
+            return []
+        
+        top = np.argpartition(-scores, n_recommendations - 1)[:n_recommendations]
+        top = top[np.argsort(-scores[top])]
+        
+        return list(zip(top.tolist(), scores[top].tolist()))
+    
+    def batch_recommend(self, user_idxs: np.ndarray, n_recommendations: int = 10,
+                        exclude_seen: Dict[int, set] = None) -> List[List[Tuple[int, float]]]:
+        """Get top N recommendations for many users, scoring them with a single GEMM"""
+        user_idxs = np.asarray(user_idxs, dtype=np.int64)
+        n_items = self.item_factors_T.shape[1]
+        if len(user_idxs) == 0 or n_items == 0:
+            return [[] for _ in user_idxs]
+        
+        scores = self.user_factors[user_idxs] @ self.item_factors_T
+        scores += self.item_biases[None, :]
+        scores += (self.user_biases[user_idxs] + self.global_mean)[:, None]
+        
+        if exclude_seen:
+            for row, user_idx in enumerate(user_idxs.tolist()):
+                seen = exclude_seen.get(user_idx)
+                if seen:
+                    scores[row, np.fromiter(seen, dtype=np.int64, count=len(seen))] = -np.inf
+        
+        n = min(n_recommendations, n_items)
+        if n <= 0:
+            return [[] for _ in user_idxs]
+        
+        top = np.argpartition(-scores, n - 1, axis=1)[:, :n]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+        
+        return [[(idx, score) for idx, score in zip(row_items, row_scores) if score != -np.inf]
+                for row_items, row_scores in zip(top.tolist(), top_scores.tolist())]
 
 class ContentBasedModel:
     """Content-based filtering for cold start problems"""
     
-    def __init__(self, max_features: int = 5000):
+    def __init__(self, max_features: int = 5000, use_gpu: bool = False,
+                 gpu_min_items: int = 1_000_000):
         self.max_features = max_features
+        self.use_gpu = use_gpu
+        self.gpu_min_items = gpu_min_items
         self.tfidf_vectorizer = None
         self.item_features = None
-        self.item_similarity_matrix = None
+        self._X_gpu = None
+    
+    def __getstate__(self):
+        # Device memory does not pickle; it is re-uploaded on unpickle
+        state = self.__dict__.copy()
+        state['_X_gpu'] = None
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._upload_to_gpu()
+    
+    def _upload_to_gpu(self):
+        """Mirror item features on the GPU when enabled, available and worth it"""
+        self._X_gpu = None
+        if (self.use_gpu and cupy is not None and self.item_features is not None and
+                self.item_features.shape[0] > self.gpu_min_items):
+            self._X_gpu = cupyx.scipy.sparse.csr_matrix(self.item_features.astype(np.float32))
         
     def fit(self, items_df: pd.DataFrame, feature_cols: List[str]):
         """Train content-based model using item features"""
-        # Combine text features
-        items_df['combined_features'] = items_df[feature_cols].apply(
-            lambda x: ' '.join(x.astype(str)), axis=1
-        )
+        # Combine text features with vectorized string concatenation
+        combined = items_df[feature_cols[0]].astype(str)
+        if len(feature_cols) > 1:
+            combined = combined.str.cat(
+                [items_df[col].astype(str) for col in feature_cols[1:]], sep=' '
+            )
+        items_df['combined_features'] = combined
         
         # Create TF-IDF vectors
         self.tfidf_vectorizer = TfidfVectorizer(
@@ -176,34 +342,100 @@ class ContentBasedModel:
             items_df['combined_features']
         )
         
-        # Calculate item similarity matrix
-        self.item_similarity_matrix = cosine_similarity(self.item_features)
+        # L2-normalize rows so a sparse dot product is the cosine similarity;
+        # similarities are computed per query instead of as an N x N matrix
+        normalize(self.item_features, copy=False)
+        self._upload_to_gpu()
     
     def get_similar_items(self, item_idx: int, n_similar: int = 10) -> List[Tuple[int, float]]:
         """Get similar items based on content features"""
-        if item_idx >= self.item_similarity_matrix.shape[0]:
+        n_items = self.item_features.shape[0]
+        if item_idx >= n_items:
+            return []
+        
+        n_similar = min(n_similar, n_items - 1)
+        if n_similar <= 0:
+            return []
+        
+        # One row computed on demand: CSR mat-vec against a dense query row writes
+        # straight into an N-vector, with no sparse result matrix in between
+        query = self.item_features[item_idx].toarray().ravel()
+        similarities = np.asarray(self.item_features @ query).ravel()
+        similarities[item_idx] = -np.inf
+        
+        # O(N) partition for the top-k, then sort only those k
+        top = np.argpartition(-similarities, n_similar - 1)[:n_similar]
+        top = top[np.argsort(-similarities[top])]
+        
+        return [(int(idx), float(similarities[idx])) for idx in top]
+    
+    def get_similar_to_items(self, item_idxs: np.ndarray, n_similar: int = 10,
+                             exclude: set = None) -> List[Tuple[int, float]]:
+        """Get items most similar to a group of items, summing similarity over the group"""
+        n_items = self.item_features.shape[0]
+        item_idxs = np.asarray(item_idxs, dtype=np.int64)
+        item_idxs = item_idxs[item_idxs < n_items]
+        if len(item_idxs) == 0:
             return []
         
-        similarities = self.item_similarity_matrix[item_idx]
-        similar_items = [(idx, sim) for idx, sim in enumerate(similarities) 
-                        if idx != item_idx]
-        similar_items.sort(key=lambda x: x[1], reverse=True)
+        excluded = item_idxs
+        if exclude:
+            extra = np.fromiter(exclude, dtype=np.int64, count=len(exclude))
+            excluded = np.concatenate([excluded, extra[extra < n_items]])
+        excluded = np.unique(excluded)
         
-        return similar_items[:n_similar]
+        n_similar = min(n_similar, n_items - len(excluded))
+        if n_similar <= 0:
+            return []
+        
+        # sum_j sim(x, x_j) == x . sum_j x_j, so one sparse mat-vec scores the whole group
+        query = np.asarray(self.item_features[item_idxs].sum(axis=0)).ravel()
+        if self._X_gpu is not None:
+            top, top_scores = self._top_k_gpu(query, excluded, n_similar)
+            return list(zip(top.tolist(), top_scores.tolist()))
+        
+        similarities = np.asarray(self.item_features @ query).ravel()
+        similarities[excluded] = -np.inf
+        
+        top = np.argpartition(-similarities, n_similar - 1)[:n_similar]
+        top = top[np.argsort(-similarities[top])]
+        
+        return [(int(idx), float(similarities[idx])) for idx in top]
+    
+    def _top_k_gpu(self, query: np.ndarray, excluded: np.ndarray,
+                   n_similar: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Score and select top-k on the GPU; only the k results cross PCIe"""
+        similarities = self._X_gpu @ cupy.asarray(query, dtype=cupy.float32)
+        similarities[cupy.asarray(excluded)] = -cupy.inf
+        
+        top = cupy.argpartition(-similarities, n_similar - 1)[:n_similar]
+        top = top[cupy.argsort(-similarities[top])]
+        
+        return cupy.asnumpy(top), cupy.asnumpy(similarities[top])
 
 class HybridRecommendationEngine:
     """Main recommendation engine combining multiple approaches"""
     
-    def __init__(self, cf_weight: float = 0.7, cb_weight: float = 0.3):
+    def __init__(self, cf_weight: float = 0.7, cb_weight: float = 0.3,
+                 redis_url: Optional[str] = None, cache_ttl: int = 300,
+                 use_gpu: bool = False, gpu_min_items: int = 1_000_000):
         self.cf_weight = cf_weight
         self.cb_weight = cb_weight
         self.data_processor = DataProcessor()
         self.cf_model = CollaborativeFilteringModel()
-        self.cb_model = ContentBasedModel()
+        self.cb_model = ContentBasedModel(use_gpu=use_gpu, gpu_min_items=gpu_min_items)
         self.interaction_matrix = None
         self.user_item_interactions = {}
+        self._pop_top = None
+        self._pop_scores = None
         self.is_trained = False
         
+        # Optional Redis cache for final recommendation lists; keys are versioned
+        # per training run so retraining invalidates everything at once
+        self.redis = redis.Redis.from_url(redis_url, decode_responses=True) if redis_url else None
+        self.cache_ttl = cache_ttl
+        self.model_version = None
+        
         # Setup logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
@@ -219,12 +451,14 @@ class HybridRecommendationEngine:
             self.interaction_matrix = self.data_processor.create_interaction_matrix(interactions_clean)
             
             # Store user-item interactions for filtering
-            for _, row in interactions_clean.iterrows():
-                user_idx = row['user_idx']
-                item_idx = row['item_idx']
-                if user_idx not in self.user_item_interactions:
-                    self.user_item_interactions[user_idx] = set()
-                self.user_item_interactions[user_idx].add(item_idx)
+            self.user_item_interactions = (
+                interactions_clean.groupby('user_idx')['item_idx'].agg(set).to_dict()
+            )
+            
+            # Precompute popularity ranking for cold-start users
+            item_popularity = np.asarray(self.interaction_matrix.sum(axis=0)).ravel()
+            self._pop_top = np.argsort(-item_popularity, kind='stable')[:1024]
+            self._pop_scores = item_popularity[self._pop_top]
             
             # Train collaborative filtering model
             self.cf_model.fit(self.interaction_matrix)
@@ -233,6 +467,7 @@ class HybridRecommendationEngine:
             self.cb_model.fit(items_df, content_features)
             
             self.is_trained = True
+            self.model_version = datetime.utcnow().strftime('%Y%m%d%H%M%S%f')
             self.logger.info("Model training completed successfully")
             
         except Exception as e:
@@ -244,6 +479,11 @@ class HybridRecommendationEngine:
         if not self.is_trained:
             raise ValueError("Model must be trained before making recommendations")
         
+        cache_key = self._cache_key(user_id, n_recommendations)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+        
         recommendations = []
         
         # Check if user exists in training data
@@ -256,39 +496,47 @@ class HybridRecommendationEngine:
                 user_idx, n_recommendations * 2, seen_items
             )
             
-            # Combine with content-based recommendations
-            cf_scores = {item_idx: score for item_idx, score in cf_recs}
-            
             # Get content-based recommendations based on user's interaction history
-            cb_scores = {}
+            cb_recs = []
             if seen_items:
-                for seen_item in list(seen_items)[:5]:  # Use last 5 interactions
-                    similar_items = self.cb_model.get_similar_items(seen_item, 20)
-                    for item_idx, similarity in similar_items:
-                        if item_idx not in seen_items:
-                            cb_scores[item_idx] = cb_scores.get(item_idx, 0) + similarity
+                seen_arr = np.fromiter(seen_items, dtype=np.int32, count=len(seen_items))[:5]  # Use 5 interactions
+                cb_recs = self.cb_model.get_similar_to_items(
+                    seen_arr, 20 * len(seen_arr), exclude=seen_items
+                )
+            
+            # Combine scores in dense per-item arrays; only CF/CB candidates are ranked
+            n_items = self.interaction_matrix.shape[1]
+            cf_arr = np.zeros(n_items, dtype=np.float32)
+            cb_arr = np.zeros(n_items, dtype=np.float32)
+            is_candidate = np.zeros(n_items, dtype=bool)
             
-            # Combine scores
-            all_items = set(cf_scores.keys()) | set(cb_scores.keys())
-            hybrid_scores = []
+            if cf_recs:
+                cf_ids = np.array([item_idx for item_idx, _ in cf_recs], dtype=np.int64)
+                cf_arr[cf_ids] = [score for _, score in cf_recs]
+                is_candidate[cf_ids] = True
+            if cb_recs:
+                cb_ids = np.array([item_idx for item_idx, _ in cb_recs], dtype=np.int64)
+                cb_vals = np.array([score for _, score in cb_recs], dtype=np.float32)
+                in_range = cb_ids < n_items
+                cb_arr[cb_ids[in_range]] = cb_vals[in_range]
+                is_candidate[cb_ids[in_range]] = True
             
-            for item_idx in all_items:
-                cf_score = cf_scores.get(item_idx, 0)
-                cb_score = cb_scores.get(item_idx, 0)
-                hybrid_score = self.cf_weight * cf_score + self.cb_weight * cb_score
-                hybrid_scores.append((item_idx, hybrid_score, cf_score, cb_score))
+            hybrid = self.cf_weight * cf_arr + self.cb_weight * cb_arr
+            hybrid[~is_candidate] = -np.inf
             
-            # Sort by hybrid score
-            hybrid_scores.sort(key=lambda x: x[1], reverse=True)
+            # Partition for the top-k, then sort only those
+            n = min(n_recommendations, int(is_candidate.sum()))
+            top = np.argpartition(-hybrid, n - 1)[:n] if n > 0 else np.empty(0, dtype=np.int64)
+            top = top[np.argsort(-hybrid[top])]
             
             # Format recommendations
-            for item_idx, hybrid_score, cf_score, cb_score in hybrid_scores[:n_recommendations]:
+            for item_idx in top.tolist():
                 item_id = self.data_processor.item_decoder[item_idx]
                 recommendations.append({
                     'item_id': item_id,
-                    'score': float(hybrid_score),
-                    'cf_score': float(cf_score),
-                    'cb_score': float(cb_score),
+                    'score': float(hybrid[item_idx]),
+                    'cf_score': float(cf_arr[item_idx]),
+                    'cb_score': float(cb_arr[item_idx]),
                     'method': 'hybrid'
                 })
         
@@ -297,19 +545,44 @@ class HybridRecommendationEngine:
             self.logger.info(f"Cold start recommendation for user {user_id}")
             recommendations = self._get_popular_items(n_recommendations)
         
+        self._cache_set(cache_key, recommendations)
         return recommendations
     
+    def _cache_key(self, user_id: str, n_recommendations: int) -> str:
+        """Build the versioned Redis key for a user's recommendation list"""
+        digest = hashlib.blake2b(f"{user_id}:{n_recommendations}".encode(), digest_size=8).hexdigest()
+        return f"rec:{self.model_version}:{digest}"
+    
+    def _cache_get(self, key: str) -> Optional[List[Dict]]:
+        """Fetch cached recommendations; cache failures are treated as misses"""
+        if self.redis is None:
+            return None
+        try:
+            cached = self.redis.get(key)
+        except redis.RedisError as e:
+            self.logger.warning(f"Recommendation cache read failed: {str(e)}")
+            return None
+        return json.loads(cached) if cached is not None else None
+    
+    def _cache_set(self, key: str, recommendations: List[Dict]):
+        """Store recommendations with a short TTL; cache failures never fail the request"""
+        if self.redis is None:
+            return
+        try:
+            payload = json.dumps(recommendations, default=lambda o: o.item() if hasattr(o, 'item') else str(o))
+            self.redis.setex(key, self.cache_ttl, payload)
+        except redis.RedisError as e:
+            self.logger.warning(f"Recommendation cache write failed: {str(e)}")
+    
     def _get_popular_items(self, n_items: int = 10) -> List[Dict]:
         """Get popular items for cold start scenarios"""
-        item_popularity = np.array(self.interaction_matrix.sum(axis=0)).flatten()
-        popular_items = np.argsort(item_popularity)[::-1][:n_items]
-        
         recommendations = []
-        for item_idx in popular_items:
+        for item_idx, popularity in zip(self._pop_top[:n_items].tolist(),
+                                        self._pop_scores[:n_items].tolist()):
             item_id = self.data_processor.item_decoder[item_idx]
             recommendations.append({
                 'item_id': item_id,
-                'score': float(item_popularity[item_idx]),
+                'score': float(popularity),
                 'cf_score': 0.0,
                 'cb_score': 0.0,
                 'method': 'popular'
@@ -317,33 +590,78 @@ class HybridRecommendationEngine:
         
         return recommendations
     
+    def save(self, path: str):
+        """Save the trained engine; CF factors go to .npy, the rest to a pickle"""
+        if not self.is_trained:
+            raise ValueError("Model must be trained before saving")
+        
+        os.makedirs(path, exist_ok=True)
+        self.cf_model.save(os.path.join(path, 'cf'))
+        
+        state = {
+            'cf_weight': self.cf_weight,
+            'cb_weight': self.cb_weight,
+            'data_processor': self.data_processor,
+            'cb_model': self.cb_model,
+            'interaction_matrix': self.interaction_matrix,
+            'user_item_interactions': self.user_item_interactions,
+            'pop_top': self._pop_top,
+            'pop_scores': self._pop_scores,
+            'model_version': self.model_version,
+        }
+        with open(os.path.join(path, 'engine.pkl'), 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    @classmethod
+    def load(cls, path: str, redis_url: Optional[str] = None,
+             cache_ttl: int = 300) -> 'HybridRecommendationEngine':
+        """Load a saved engine with memory-mapped CF factors"""
+        with open(os.path.join(path, 'engine.pkl'), 'rb') as f:
+            state = pickle.load(f)
+        
+        engine = cls(state['cf_weight'], state['cb_weight'], redis_url, cache_ttl)
+        engine.cf_model = CollaborativeFilteringModel.load(os.path.join(path, 'cf'))
+        engine.data_processor = state['data_processor']
+        engine.cb_model = state['cb_model']
+        engine.interaction_matrix = state['interaction_matrix']
+        engine.user_item_interactions = state['user_item_interactions']
+        engine._pop_top = state['pop_top']
+        engine._pop_scores = state['pop_scores']
+        engine.model_version = state['model_version']
+        engine.is_trained = True
+        
+        return engine
+    
     def evaluate(self, test_interactions: pd.DataFrame) -> Dict[str, float]:
         """Evaluate model performance"""
         if not self.is_trained:
             raise ValueError("Model must be trained before evaluation")
         
-        # Preprocess test data
+        # Preprocess test data: encode in one hashed pass, dropping unknown users/items
         test_clean = test_interactions.copy()
-        test_clean = test_clean[
-            (test_clean['user_id'].isin(self.data_processor.user_encoder.keys())) &
-            (test_clean['item_id'].isin(self.data_processor.item_encoder.keys()))
-        ]
+        test_clean['user_idx'] = test_clean['user_id'].map(self.data_processor.user_encoder)
+        test_clean['item_idx'] = test_clean['item_id'].map(self.data_processor.item_encoder)
+        test_clean = test_clean.dropna(subset=['user_idx', 'item_idx'])
         
         if test_clean.empty:
             return {'rmse': float('inf'), 'mae': float('inf')}
         
-        test_clean['user_idx'] = test_clean['user_id'].map(self.data_processor.user_encoder)
-        test_clean['item_idx'] = test_clean['item_id'].map(self.data_processor.item_encoder)
+        # Calculate predictions for all test pairs in one batched pass
+        cf = self.cf_model
+        u = test_clean['user_idx'].to_numpy(dtype=np.int64)
+        i = test_clean['item_idx'].to_numpy(dtype=np.int64)
+        predictions = (cf.global_mean + cf.user_biases[u] + cf.item_biases[i] +
+                       np.einsum('ij,ij->i', cf.user_factors[u], cf.item_factors[i]))
+        np.clip(predictions, 0, 5, out=predictions)  # Clamp between 0-5
         
-        # Calculate predictions
-        predictions = []
-        actual = []
-        
-        for _, row in test_clean.iterrows():
-            pred = self.cf_model.predict(row['user_idx'], row['item_idx'])
-            predictions.append(pred)
-            actual.append(row.get('rating', 1.0))
+        if 'rating' in test_clean.columns:
+            actual = test_clean['rating'].to_numpy(dtype=np.float64)
+        else:
+            actual = np.ones(len(test_clean))
         
         # Calculate metrics
         rmse = np.sqrt(mean_squared_error(actual, predictions))
-        mae = np.mean(np.abs(np.array(actual
\ No newline at end of file
+        mae = np.mean(np.abs(actual - predictions))
+        
+        return {'rmse': float(rmse), 'mae': float(mae)}
+```
@@ -13,6 +13,7 @@ python-multipart==0.0.6
 slowapi==0.1.9
 python-decouple==3.8
 redis==5.0.1
+cachetools==5.3.2
 """
 
 # .env
@@ -75,8 +76,7 @@ def get_db():
         db.close()
 
 # models.py
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, Index
 from sqlalchemy.sql import func
 from database import Base
 import uuid
@@ -95,8 +95,10 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
-    # Relationships
-    refresh_tokens = relationship("RefreshToken", back_populates="user", cascade="all, delete-orphan")
+    # Covering index for get_current_user's (id, is_active, is_admin) lookup (index-only scan on Postgres)
+    __table_args__ = (
+        Index("ix_users_id_active", "id", postgresql_include=["is_active", "is_admin"]),
+    )
 
 class Product(Base):
     __tablename__ = "products"
@@ -114,19 +116,6 @@ class Product(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-class RefreshToken(Base):
-    __tablename__ = "refresh_tokens"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    token = Column(String(255), unique=True, index=True, nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    expires_at = Column(DateTime(timezone=True), nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    is_revoked = Column(Boolean, default=False)
-    
-    # Relationships
-    user = relationship("User", back_populates="refresh_tokens")
-
 # alembic/env.py
 from logging.config import fileConfig
 from sqlalchemy import engine_from_config, pool
@@ -291,21 +280,44 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, load_only
+from cachetools import TTLCache
 from config import settings
 from database import get_db
 import models
+import hashlib
+import redis
+import threading
+import time
 import uuid
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context (11 rounds is half the CPU of the default 12)
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=11)
+
+# Short-lived cache of successful password verifications for repeated logins
+_verified_passwords = TTLCache(maxsize=10_000, ttl=60)
+_verified_passwords_lock = threading.Lock()
 
 # OAuth2 bearer token scheme
 security = HTTPBearer()
 
+# Redis client for refresh-token revocation
+redis_client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password."""
-    return pwd_context.verify(plain_password, hashed_password)
+    key = (hashlib.sha256(plain_password.encode()).hexdigest(), hashed_password)
+    with _verified_passwords_lock:
+        if key in _verified_passwords:
+            return True
+    
+    if not pwd_context.verify(plain_password, hashed_password):
+        return False
+    
+    with _verified_passwords_lock:
+        _verified_passwords[key] = True
+    return True
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
@@ -319,26 +331,26 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire, "type": "access"})
+    to_encode.update({"exp": expire, "type": "access", "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
-def create_refresh_token(user_id: int, db: Session) -> str:
-    """Create and store a refresh token."""
-    # Generate unique token
-    token = str(uuid.uuid4())
-    expires_at = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    
-    # Store in database
-    db_token = models.RefreshToken(
-        token=token,
-        user_id=user_id,
-        expires_at=expires_at
-    )
-    db.add(db_token)
-    db.commit()
+def create_refresh_token(user_id: int) -> str:
+    """Create a signed, stateless refresh token."""
+    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    to_encode = {"sub": str(user_id), "jti": uuid.uuid4().hex, "type": "refresh", "exp": expire}
+    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+def _decode_refresh_token(token: str) -> Optional[dict]:
+    """Decode a refresh token, returning None if it is invalid, expired or not a refresh token."""
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
     
-    return token
+    if payload.get("type") != "refresh" or payload.get("sub") is None or payload.get("jti") is None:
+        return None
+    return payload
 
 def verify_token(token: str, token_type: str = "access") -> dict:
     """Verify and decode a JWT token."""
@@ -354,7 +366,7 @@ def verify_token(token: str, token_type: str = "access") -> dict:
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        return {"user_id": user_id}
+        return {"user_id": user_id, "jti": payload.get("jti"), "exp": payload.get("exp")}
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -366,11 +378,15 @@ def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> models.User:
-    """Get the current authenticated user."""
-    token = credentials.credentials
-    token_data = verify_token(token)
+    """Get the current authenticated user (always checked against the fresh row)."""
+    token_data = verify_token(credentials.credentials)
     
-    user = db.query(models.User).filter(models.User.id == token_data["user_id"]).first()
+    # Only the auth columns are fetched; the rest are deferred and load on access
+    user = db.execute(
+        select(models.User)
+        .options(load_only(models.User.id, models.User.is_active, models.User.is_admin))
+        .where(models.User.id == int(token_data["user_id"]))
+    ).scalar_one_or_none()
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -405,24 +421,40 @@ def authenticate_user(db: Session, email: str, password: str) -> Union[models.Us
     return user
 
 def revoke_refresh_token(db: Session, token: str):
-    """Revoke a refresh token."""
-    db_token = db.query(models.RefreshToken).filter(models.RefreshToken.token == token).first()
-    if db_token:
-        db_token.is_revoked = True
-        db.commit()
+    """Revoke a refresh token by marking its jti revoked until the token would expire."""
+    payload = _decode_refresh_token(token)
+    if payload is None:
+        return
+    
+    ttl = int(payload["exp"] - time.time())
+    if ttl <= 0:
+        return
+    try:
+        redis_client.set(f"revoked_jti:{payload['jti']}", 1, ex=ttl)
+    except redis.RedisError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Could not revoke token, try again later",
+        )
 
 def verify_refresh_token(db: Session, token: str) -> Optional[models.User]:
     """Verify a refresh token and return the associated user."""
-    db_token = db.query(models.RefreshToken).filter(
-        models.RefreshToken.token == token,
-        models.RefreshToken.is_revoked == False,
-        models.RefreshToken.expires_at > datetime.utcnow()
-    ).first()
+    payload = _decode_refresh_token(token)
+    if payload is None:
+        return None
     
-    if not db_token:
+    # Fail closed: without the revocation list a revoked token cannot be told apart
+    try:
+        revoked = redis_client.exists(f"revoked_jti:{payload['jti']}")
+    except redis.RedisError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Token verification unavailable, try again later",
+        )
+    if revoked:
         return None
     
-    return db_token.user
+    return db.get(models.User, int(payload["sub"]))
 
 # routers/auth.py
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -1,376 +1,827 @@
 ```python
 # backend/app.py
-from flask import Flask, request, jsonify
-from flask_sqlalchemy import SQLAlchemy
-from flask_cors import CORS
-from flask_mail import Mail, Message
-from werkzeug.security import generate_password_hash, check_password_hash
+from fastapi import BackgroundTasks, Depends, FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from slowapi import Limiter
+from slowapi.errors import RateLimitExceeded
+from slowapi.util import get_remote_address
+from sqlalchemy import Boolean, Column, DateTime, Integer, String, event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, declarative_base, make_transient_to_detached
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from cryptography.hazmat.primitives.serialization import (
+    Encoding, NoEncryption, PrivateFormat, load_pem_private_key
+)
+from contextlib import asynccontextmanager
+from email.message import EmailMessage
 import jwt
+import orjson
 import datetime
-import secrets
-import re
-from functools import wraps
+import base64
+import smtplib
+import string
+import hashlib
+import threading
+import time
 import os
+import tempfile
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 load_dotenv()
 
-app = Flask(__name__)
-app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'your-secret-key-here')
-app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL', 'sqlite:///auth.db')
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+SECRET_KEY = os.getenv('SECRET_KEY', 'your-secret-key-here')
+
+# JWT signing: Ed25519 keypair persisted as PEM; HS256 still accepted during rollover
+JWT_PRIVATE_KEY_PATH = os.getenv('JWT_PRIVATE_KEY_PATH', 'jwt_ed25519.pem')
+JWT_ACCEPT_HS256 = os.getenv('JWT_ACCEPT_HS256', '1') == '1'
+# Async drivers for plain (sync-style) URL schemes, so pre-FastAPI DATABASE_URLs keep working
+_ASYNC_DRIVERS = {
+    'sqlite': 'sqlite+aiosqlite',
+    'postgresql': 'postgresql+asyncpg',
+    'postgres': 'postgresql+asyncpg',
+    'mysql': 'mysql+aiomysql',
+}
+
+def _async_database_url(url):
+    """Map a plain database URL onto its async driver; URLs naming a driver pass through"""
+    scheme, sep, rest = url.partition('://')
+    if not sep:
+        raise RuntimeError(f"DATABASE_URL is not a valid database URL: {url!r}")
+    if '+' in scheme:
+        return url
+    if scheme not in _ASYNC_DRIVERS:
+        raise RuntimeError(
+            f"DATABASE_URL scheme {scheme!r} has no known async driver; "
+            f"name one explicitly, e.g. {scheme}+<driver>://"
+        )
+    return f"{_ASYNC_DRIVERS[scheme]}://{rest}"
+
+DATABASE_URL = _async_database_url(os.getenv('DATABASE_URL', 'sqlite:///auth.db'))
+# memory:// is per-process; use redis://... when running several workers
+RATELIMIT_STORAGE_URI = os.getenv('RATELIMIT_STORAGE_URI', 'memory://')
+AUTH_RATE_LIMIT = os.getenv('AUTH_RATE_LIMIT', '5/minute')
+# Schema creation is opt-in so warm deployments skip it at startup
+INIT_DB = os.getenv('INIT_DB') == '1'
 
 # Email configuration
-app.config['MAIL_SERVER'] = os.getenv('MAIL_SERVER', 'smtp.gmail.com')
-app.config['MAIL_PORT'] = int(os.getenv('MAIL_PORT', 587))
-app.config['MAIL_USE_TLS'] = True
-app.config['MAIL_USERNAME'] = os.getenv('MAIL_USERNAME')
-app.config['MAIL_PASSWORD'] = os.getenv('MAIL_PASSWORD')
+MAIL_SERVER = os.getenv('MAIL_SERVER', 'smtp.gmail.com')
+MAIL_PORT = int(os.getenv('MAIL_PORT', 587))
+MAIL_USE_TLS = True
+MAIL_USERNAME = os.getenv('MAIL_USERNAME')
+MAIL_PASSWORD = os.getenv('MAIL_PASSWORD')
+
+# Async engine: one event loop serves many requests waiting on DB/SMTP I/O
+_is_sqlite = DATABASE_URL.startswith('sqlite')
+_engine_options = {'pool_pre_ping': True}
+if not _is_sqlite:
+    _engine_options.update(pool_size=20, max_overflow=10)
+engine = create_async_engine(DATABASE_URL, **_engine_options)
+
+if _is_sqlite:
+    @event.listens_for(engine.sync_engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # WAL lets readers proceed during a write; NORMAL sync is durable enough under WAL
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA cache_size=-64000')
+        cursor.close()
+
+SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
+Base = declarative_base()
+
+async def get_db():
+    async with SessionLocal() as session:
+        yield session
+
+@asynccontextmanager
+async def lifespan(app):
+    # Initialize database (INIT_DB=1)
+    if INIT_DB:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    yield
+    await engine.dispose()
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+
+# Per-IP limits on the endpoints that cost a password hash or an email
+limiter = Limiter(key_func=get_remote_address, storage_uri=RATELIMIT_STORAGE_URI)
+app.state.limiter = limiter
+
+@app.exception_handler(RateLimitExceeded)
+async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
+    return json_response({'error': 'Too many requests, try again later'}, 429)
+
+# Memory-hard password hashing tuned for ~50-100ms per hash
+_ph = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+# Verified against when the login email is unknown, so both paths cost one hash
+_DUMMY_HASH = _ph.hash('x' * 16)
+
+def _verify_dummy_password(password):
+    """Spend the same hashing work as a real verification, always failing"""
+    try:
+        _ph.verify(_DUMMY_HASH, password)
+    except VerificationError:
+        pass
+    return False
+
+def _load_signing_key(path):
+    """Load the Ed25519 signing key, generating and persisting one on first start"""
+    if not os.path.exists(path):
+        pem = Ed25519PrivateKey.generate().private_bytes(
+            Encoding.PEM, PrivateFormat.PKCS8, NoEncryption()
+        )
+        # Write the full key to a private temp file, then publish it with link(), which
+        # fails if the path exists: readers never see a partial file and one key wins
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(pem)
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                os.link(tmp_path, path)
+            except FileExistsError:
+                pass  # Another worker published its key first
+        finally:
+            os.unlink(tmp_path)
+    
+    with open(path, 'rb') as f:
+        return load_pem_private_key(f.read(), password=None)
+
+_jwt_private_key = _load_signing_key(JWT_PRIVATE_KEY_PATH)
+_jwt_public_key = _jwt_private_key.public_key()
+
+def _verify_password_hash(password_hash, password):
+    """Verify a password; returns (matches, upgraded hash or None) for legacy/outdated hashes"""
+    if password_hash.startswith('pbkdf2:'):
+        if not check_password_hash(password_hash, password):
+            return False, None
+        return True, _ph.hash(password)
+    
+    try:
+        _ph.verify(password_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False, None
+    
+    if _ph.check_needs_rehash(password_hash):
+        return True, _ph.hash(password)
+    return True, None
+
+# Entropy pool: one getrandom() syscall per 128 tokens; every byte is handed out once
+_ENTROPY_POOL_SIZE = 4096
+_entropy_pool = os.urandom(_ENTROPY_POOL_SIZE)
+_entropy_offset = 0
+_entropy_lock = threading.Lock()
+
+def _reset_entropy_pool():
+    # Forked workers must not hand out the parent's remaining bytes
+    global _entropy_pool, _entropy_offset, _entropy_lock
+    _entropy_pool = os.urandom(_ENTROPY_POOL_SIZE)
+    _entropy_offset = 0
+    _entropy_lock = threading.Lock()
 
-db = SQLAlchemy(app)
-mail = Mail(app)
-CORS(app, origins=["http://localhost:3000"])
+os.register_at_fork(after_in_child=_reset_entropy_pool)
+
+def _token_urlsafe(nbytes=32):
+    """Drop-in for secrets.token_urlsafe drawing from the shared entropy pool"""
+    global _entropy_pool, _entropy_offset
+    with _entropy_lock:
+        if _entropy_offset + nbytes > _ENTROPY_POOL_SIZE:
+            _entropy_pool = os.urandom(_ENTROPY_POOL_SIZE)
+            _entropy_offset = 0
+        raw = _entropy_pool[_entropy_offset:_entropy_offset + nbytes]
+        _entropy_offset += nbytes
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+
+def _hash_reset_token(token):
+    """Hash a reset token for storage and lookup; the raw token is only ever emailed"""
+    return hashlib.sha256(token.encode()).hexdigest()
 
 # User Model
-class User(db.Model):
+class User(Base):
     __tablename__ = 'users'
     
-    id = db.Column(db.Integer, primary_key=True)
-    email = db.Column(db.String(120), unique=True, nullable=False, index=True)
-    password_hash = db.Column(db.String(255), nullable=False)
-    reset_token = db.Column(db.String(255), nullable=True)
-    reset_token_expires = db.Column(db.DateTime, nullable=True)
-    created_at = db.Column(db.DateTime, default=datetime.datetime.utcnow)
-    is_verified = db.Column(db.Boolean, default=False)
+    id = Column(Integer, primary_key=True)
+    email = Column(String(120), unique=True, nullable=False, index=True)
+    password_hash = Column(String(255), nullable=False)
+    reset_token_hash = Column(String(64), nullable=True, index=True)
+    reset_token_expires = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    is_verified = Column(Boolean, default=False)
     
     def set_password(self, password):
         """Hash and set password"""
-        self.password_hash = generate_password_hash(password, method='pbkdf2:sha256')
+        self.password_hash = _ph.hash(password)
     
     def check_password(self, password):
-        """Verify password against hash"""
-        return check_password_hash(self.password_hash, password)
+        """Verify password against hash, upgrading legacy or outdated hashes in place"""
+        matches, upgraded_hash = _verify_password_hash(self.password_hash, password)
+        if upgraded_hash is not None:
+            self.set_password_hash(upgraded_hash)
+        return matches
+    
+    def set_password_hash(self, password_hash):
+        """Store an already computed password hash"""
+        self.password_hash = password_hash
     
     def generate_reset_token(self):
         """Generate secure reset token"""
-        self.reset_token = secrets.token_urlsafe(32)
+        reset_token = _token_urlsafe(32)
+        self.reset_token_hash = _hash_reset_token(reset_token)
         self.reset_token_expires = datetime.datetime.utcnow() + datetime.timedelta(hours=1)
-        return self.reset_token
+        return reset_token
+    
+    @property
+    def created_at_iso(self):
+        """ISO form of created_at, formatted once per cached user (the column never changes)"""
+        created_at_iso = self.__dict__.get('_created_at_iso')
+        if created_at_iso is None:
+            created_at_iso = self.created_at.isoformat()
+            self.__dict__['_created_at_iso'] = created_at_iso
+        return created_at_iso
     
     def to_dict(self):
         """Convert user object to dictionary"""
         return {
             'id': self.id,
             'email': self.email,
-            'created_at': self.created_at.isoformat(),
+            'created_at': self.created_at_iso,
             'is_verified': self.is_verified
         }
 
+# Verified JWT payloads keyed by token digest, so hot tokens skip HMAC verification
+_jwt_cache = TTLCache(maxsize=10000, ttl=30)
+_jwt_cache_lock = threading.Lock()
+
+# Recently authenticated users keyed by id, so get_current_user skips the SELECT.
+# Entries are detached column snapshots, never a live instance owned by some session
+_user_cache = TTLCache(maxsize=5000, ttl=60)
+_user_cache_lock = threading.Lock()
+
+# Failed logins per client IP; past the limit, requests are refused before hashing
+MAX_LOGIN_FAILURES = 5
+_login_failures = TTLCache(maxsize=100000, ttl=60)
+_login_failures_lock = threading.Lock()
+
+def _record_login_failure(client_ip):
+    """Count a failed login; the window slides while failures keep coming"""
+    with _login_failures_lock:
+        _login_failures[client_ip] = _login_failures.get(client_ip, 0) + 1
+
+def _invalidate_cached_user(user_id):
+    """Drop a user from the auth cache after credential changes"""
+    if user_id is None:
+        return
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+# Users flushed in a transaction leave the auth cache only once it commits; clearing
+# earlier would let a concurrent request re-cache the still-committed old row
+@event.listens_for(Session, 'after_flush')
+def _collect_changed_users(session, flush_context):
+    changed = session.info.setdefault('changed_user_ids', set())
+    for obj in (*session.dirty, *session.deleted):
+        if isinstance(obj, User) and obj.id is not None:
+            changed.add(obj.id)
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed_users(session):
+    for user_id in session.info.pop('changed_user_ids', ()):
+        _invalidate_cached_user(user_id)
+
+@event.listens_for(Session, 'after_rollback')
+def _evict_rolled_back_users(session):
+    # Rolled-back rows may have been re-read mid-transaction; drop them to be safe
+    for user_id in session.info.pop('changed_user_ids', ()):
+        _invalidate_cached_user(user_id)
+
+_USER_COLUMNS = tuple(column.key for column in User.__table__.columns)
+
+def _snapshot_user(user):
+    """Copy a user's column values (and ISO timestamp) for the auth cache"""
+    return {key: getattr(user, key) for key in _USER_COLUMNS}, user.created_at_iso
+
+def _user_from_snapshot(snapshot):
+    """Build a fresh, clean detached User from a cached snapshot"""
+    values, created_at_iso = snapshot
+    user = User(**values)
+    make_transient_to_detached(user)
+    user.__dict__['_created_at_iso'] = created_at_iso
+    return user
+
+# Validation patterns and character classes, built once at import
+_TLD_CHARS = frozenset(string.ascii_letters)
+_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + '.-')
+_LOCAL_CHARS = _DOMAIN_CHARS | frozenset('_%+')
+_UPPERS = frozenset(string.ascii_uppercase)
+_LOWERS = frozenset(string.ascii_lowercase)
+_SPECIALS = frozenset('!@#$%^&*(),.?":{}|<>')
+
+JWT_EXPIRES_SECONDS = 7 * 86400
+
+# Input bounds, enforced before any hashing or regex sees the data
+MAX_CONTENT_LENGTH = 4096
+MAX_EMAIL_LENGTH = 254
+MAX_PASSWORD_LENGTH = 128
+
+# Health-check timestamp, regenerated at most once per second
+_health_timestamp = (0, '')
+
 # Utility Functions
+def json_response(payload, status_code=200):
+    """Build a JSON response in the {'error': ...} / payload shape the frontend expects"""
+    return ORJSONResponse(payload, status_code=status_code)
+
+@app.middleware('http')
+async def limit_body_size(request: Request, call_next):
+    """Reject oversized bodies up front based on the declared Content-Length"""
+    content_length = request.headers.get('content-length')
+    if content_length and content_length.isdigit() and int(content_length) > MAX_CONTENT_LENGTH:
+        return json_response({'error': 'Request body too large'}, 413)
+    return await call_next(request)
+
+# Added last so CORS is outermost and headers reach every response, 413s included
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["http://localhost:3000"],
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+async def get_json(request):
+    """Parse the request body as a JSON object, or None if it is missing, malformed or too large"""
+    # Read incrementally so chunked uploads without Content-Length stop at the limit
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > MAX_CONTENT_LENGTH:
+            return None
+        chunks.append(chunk)
+    body = b''.join(chunks)
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+def inputs_too_long(email=None, passwords=()):
+    """Check email/password length bounds"""
+    if email is not None and len(email) > MAX_EMAIL_LENGTH:
+        return True
+    return any(len(password) > MAX_PASSWORD_LENGTH for password in passwords)
+
+def normalize_email(email):
+    """Strip and lowercase an email, returning the input itself when already normalized"""
+    email = email.strip()
+    return email if email.islower() else email.lower()
+
 def validate_email(email):
-    """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    """Validate email format (local@domain.tld) in one linear pass, no regex backtracking"""
+    local, sep, domain = email.partition('@')
+    if not sep or not local:
+        return False
+    host, dot, tld = domain.rpartition('.')
+    if not dot or not host or len(tld) < 2:
+        return False
+    return (_LOCAL_CHARS.issuperset(local)
+            and _DOMAIN_CHARS.issuperset(host)
+            and _TLD_CHARS.issuperset(tld))
 
 def validate_password_strength(password):
     """Validate password meets security requirements"""
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
-    if not re.search(r'[A-Z]', password):
+    
+    # Single pass over the password, stopping once every class has been seen
+    has_upper = has_lower = has_digit = has_special = False
+    for ch in password:
+        if ch in _UPPERS:
+            has_upper = True
+        elif ch in _LOWERS:
+            has_lower = True
+        elif ch.isdecimal():
+            has_digit = True
+        elif ch in _SPECIALS:
+            has_special = True
+        else:
+            continue
+        if has_upper and has_lower and has_digit and has_special:
+            break
+    
+    if not has_upper:
         return False, "Password must contain at least one uppercase letter"
-    if not re.search(r'[a-z]', password):
+    if not has_lower:
         return False, "Password must contain at least one lowercase letter"
-    if not re.search(r'\d', password):
+    if not has_digit:
         return False, "Password must contain at least one number"
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if not has_special:
         return False, "Password must contain at least one special character"
     return True, "Password is strong"
 
 def generate_jwt_token(user_id):
     """Generate JWT token for user"""
+    now = int(time.time())
     payload = {
         'user_id': user_id,
-        'exp': datetime.datetime.utcnow() + datetime.timedelta(days=7),
-        'iat': datetime.datetime.utcnow()
+        'exp': now + JWT_EXPIRES_SECONDS,
+        'iat': now
     }
-    return jwt.encode(payload, app.config['SECRET_KEY'], algorithm='HS256')
+    return jwt.encode(payload, _jwt_private_key, algorithm='EdDSA')
 
 def decode_jwt_token(token):
     """Decode and validate JWT token"""
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    with _jwt_cache_lock:
+        cached = _jwt_cache.get(key)
+    if cached is not None:
+        user_id, exp = cached
+        # Still enforce expiry on every request, even for cached tokens
+        if exp > time.time():
+            return user_id
+        return None
+    
     try:
-        payload = jwt.decode(token, app.config['SECRET_KEY'], algorithms=['HS256'])
-        return payload['user_id']
+        if JWT_ACCEPT_HS256 and jwt.get_unverified_header(token).get('alg') == 'HS256':
+            # Legacy tokens minted before the EdDSA switch
+            payload = jwt.decode(token, SECRET_KEY, algorithms=['HS256'])
+        else:
+            payload = jwt.decode(token, _jwt_public_key, algorithms=['EdDSA'])
     except jwt.ExpiredSignatureError:
         return None
     except jwt.InvalidTokenError:
         return None
+    
+    with _jwt_cache_lock:
+        _jwt_cache[key] = (payload['user_id'], payload['exp'])
+    return payload['user_id']
 
-def token_required(f):
-    """Decorator to protect routes with JWT authentication"""
-    @wraps(f)
-    def decorated(*args, **kwargs):
-        token = request.headers.get('Authorization')
-        
-        if not token:
-            return jsonify({'error': 'Token is missing'}), 401
-        
-        try:
-            # Remove 'Bearer ' prefix if present
-            if token.startswith('Bearer '):
-                token = token[7:]
-            
-            user_id = decode_jwt_token(token)
-            if user_id is None:
-                return jsonify({'error': 'Token is invalid or expired'}), 401
+class AuthError(Exception):
+    """Raised by get_current_user; rendered as a 401 {'error': ...} response"""
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+
+@app.exception_handler(AuthError)
+async def auth_error_handler(request: Request, exc: AuthError):
+    return json_response({'error': exc.message}, 401)
+
+async def get_current_user(request: Request, db: AsyncSession = Depends(get_db)) -> User:
+    """Dependency to protect routes with JWT authentication"""
+    token = request.headers.get('Authorization')
+    
+    if not token:
+        raise AuthError('Token is missing')
+    
+    try:
+        # Remove 'Bearer ' prefix if present
+        if token.startswith('Bearer '):
+            token = token[7:]
+        
+        user_id = decode_jwt_token(token)
+        if user_id is None:
+            raise AuthError('Token is invalid or expired')
+        
+        with _user_cache_lock:
+            snapshot = _user_cache.get(user_id)
+        if snapshot is not None:
+            # Attach a new instance to this request's session without hitting the DB
+            current_user = _user_from_snapshot(snapshot)
+            db.add(current_user)
+        else:
+            current_user = await db.get(User, user_id)
+            if current_user:
+                snapshot = _snapshot_user(current_user)
+                with _user_cache_lock:
+                    _user_cache[user_id] = snapshot
+        
+        if not current_user:
+            raise AuthError('User not found')
             
-            current_user = User.query.get(user_id)
-            if not current_user:
-                return jsonify({'error': 'User not found'}), 401
-                
-        except Exception as e:
-            return jsonify({'error': 'Token is invalid'}), 401
-        
-        return f(current_user, *args, **kwargs)
-    return decorated
+    except AuthError:
+        raise
+    except Exception as e:
+        raise AuthError('Token is invalid')
+    
+    return current_user
 
-def send_reset_email(user_email, reset_token):
-    """Send password reset email"""
+async def get_user_by_email(db, email):
+    """Look up a user by (normalized) email"""
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalar_one_or_none()
+
+def _send_reset_email(user_email, reset_token):
+    """Build and send the password reset email (runs as a background task)"""
     try:
-        reset_url = f"http://localhost:3000/reset-password?token={reset_token}"
-        msg = Message(
-            'Password Reset Request',
-            sender=app.config['MAIL_USERNAME'],
-            recipients=[user_email]
-        )
-        msg.body = f'''
-        You requested a password reset. Click the link below to reset your password:
-        
-        {reset_url}
-        
-        This link will expire in 1 hour.
-        
-        If you didn't request this, please ignore this email.
-        '''
-        mail.send(msg)
-        return True
+        _deliver_reset_email(user_email, reset_token)
     except Exception as e:
         print(f"Error sending email: {e}")
-        return False
+
+def _deliver_reset_email(user_email, reset_token):
+    """Send password reset email over SMTP"""
+    reset_url = f"http://localhost:3000/reset-password?token={reset_token}"
+    msg = EmailMessage()
+    msg['Subject'] = 'Password Reset Request'
+    msg['From'] = MAIL_USERNAME
+    msg['To'] = user_email
+    msg.set_content(f'''
+    You requested a password reset. Click the link below to reset your password:
+    
+    {reset_url}
+    
+    This link will expire in 1 hour.
+    
+    If you didn't request this, please ignore this email.
+    ''')
+    
+    with smtplib.SMTP(MAIL_SERVER, MAIL_PORT) as smtp:
+        if MAIL_USE_TLS:
+            smtp.starttls()
+        if MAIL_USERNAME:
+            smtp.login(MAIL_USERNAME, MAIL_PASSWORD)
+        smtp.send_message(msg)
+
+async def _issue_reset_token(email):
+    """Generate, store and email a reset token (runs as a background task)"""
+    async with SessionLocal() as db:
+        try:
+            user = await get_user_by_email(db, email)
+            if not user:
+                return
+            reset_token = user.generate_reset_token()
+            await db.commit()
+        except Exception as e:
+            await db.rollback()
+            print(f"Error issuing reset token: {e}")
+            return
+    
+    await run_in_threadpool(_send_reset_email, user.email, reset_token)
+
+def queue_password_reset(background_tasks, email):
+    """Queue the whole reset flow for after the response is sent"""
+    background_tasks.add_task(_issue_reset_token, email)
 
 # Authentication Routes
-@app.route('/auth/signup', methods=['POST'])
-def signup():
+@app.post('/auth/signup')
+@limiter.limit(AUTH_RATE_LIMIT)
+async def signup(request: Request, db: AsyncSession = Depends(get_db)):
     """User registration endpoint"""
     try:
-        data = request.get_json()
+        data = await get_json(request)
         
         # Validate required fields
         if not data or not data.get('email') or not data.get('password'):
-            return jsonify({'error': 'Email and password are required'}), 400
+            return json_response({'error': 'Email and password are required'}, 400)
+        
+        if inputs_too_long(data['email'], (data['password'],)):
+            return json_response({'error': 'Input too long'}, 400)
         
-        email = data['email'].lower().strip()
+        email = normalize_email(data['email'])
         password = data['password']
         
         # Validate email format
         if not validate_email(email):
-            return jsonify({'error': 'Invalid email format'}), 400
+            return json_response({'error': 'Invalid email format'}, 400)
         
-        # Check if user already exists
-        existing_user = User.query.filter_by(email=email).first()
+        # Check if user already exists (id only, no ORM instance)
+        existing_user = (await db.execute(select(User.id).where(User.email == email))).first()
         if existing_user:
-            return jsonify({'error': 'User with this email already exists'}), 409
+            return json_response({'error': 'User with this email already exists'}, 409)
         
         # Validate password strength
         is_strong, message = validate_password_strength(password)
         if not is_strong:
-            return jsonify({'error': message}), 400
+            return json_response({'error': message}, 400)
         
-        # Create new user
+        # Create new user (hashing is CPU-bound, keep it off the event loop)
         new_user = User(email=email)
-        new_user.set_password(password)
+        await run_in_threadpool(new_user.set_password, password)
         
-        db.session.add(new_user)
-        db.session.commit()
+        db.add(new_user)
+        await db.commit()
         
         # Generate JWT token
         token = generate_jwt_token(new_user.id)
         
-        return jsonify({
+        return json_response({
             'message': 'User created successfully',
             'token': token,
             'user': new_user.to_dict()
-        }), 201
+        }, 201)
         
     except Exception as e:
-        db.session.rollback()
-        return jsonify({'error': 'Internal server error'}), 500
+        await db.rollback()
+        return json_response({'error': 'Internal server error'}, 500)
 
-@app.route('/auth/login', methods=['POST'])
-def login():
+@app.post('/auth/login')
+@limiter.limit(AUTH_RATE_LIMIT)
+async def login(request: Request, db: AsyncSession = Depends(get_db)):
     """User login endpoint"""
     try:
-        data = request.get_json()
+        data = await get_json(request)
         
         # Validate required fields
         if not data or not data.get('email') or not data.get('password'):
-            return jsonify({'error': 'Email and password are required'}), 400
+            return json_response({'error': 'Email and password are required'}, 400)
         
-        email = data['email'].lower().strip()
+        if inputs_too_long(data['email'], (data['password'],)):
+            return json_response({'error': 'Input too long'}, 400)
+        
+        email = normalize_email(data['email'])
         password = data['password']
         
-        # Find user by email
-        user = User.query.filter_by(email=email).first()
+        # Refuse clients with too many recent failures without hashing anything
+        client_ip = request.client.host if request.client else 'unknown'
+        with _login_failures_lock:
+            failures = _login_failures.get(client_ip, 0)
+        if failures >= MAX_LOGIN_FAILURES:
+            return json_response({'error': 'Too many failed login attempts'}, 429)
+        
+        # Fetch only what credential verification needs
+        credentials = (await db.execute(
+            select(User.id, User.password_hash).where(User.email == email)
+        )).first()
+        
+        # Verify credentials; unknown emails still pay for one hash (no timing oracle)
+        if not credentials:
+            await run_in_threadpool(_verify_dummy_password, password)
+            _record_login_failure(client_ip)
+            return json_response({'error': 'Invalid email or password'}, 401)
+        matches, upgraded_hash = await run_in_threadpool(
+            _verify_password_hash, credentials.password_hash, password
+        )
+        if not matches:
+            _record_login_failure(client_ip)
+            return json_response({'error': 'Invalid email or password'}, 401)
+        
+        # Load the full user only after a successful verification; the projection
+        # never populates the identity map, so this is a second (primary-key) SELECT
+        user = await db.get(User, credentials.id)
         
-        # Verify credentials
-        if not user or not user.check_password(password):
-            return jsonify({'error': 'Invalid email or password'}), 401
+        # Persist a hash upgraded during verification
+        if upgraded_hash is not None:
+            user.set_password_hash(upgraded_hash)
+            await db.commit()
         
         # Generate JWT token
         token = generate_jwt_token(user.id)
         
-        return jsonify({
+        return json_response({
             'message': 'Login successful',
             'token': token,
             'user': user.to_dict()
-        }), 200
+        }, 200)
         
     except Exception as e:
-        return jsonify({'error': 'Internal server error'}), 500
+        return json_response({'error': 'Internal server error'}, 500)
 
-@app.route('/auth/verify-token', methods=['GET'])
-@token_required
-def verify_token(current_user):
+@app.get('/auth/verify-token')
+async def verify_token(current_user: User = Depends(get_current_user)):
     """Verify JWT token and return user info"""
-    return jsonify({
+    return json_response({
         'message': 'Token is valid',
         'user': current_user.to_dict()
-    }), 200
+    }, 200)
 
-@app.route('/auth/forgot-password', methods=['POST'])
-def forgot_password():
+@app.post('/auth/forgot-password')
+@limiter.limit(AUTH_RATE_LIMIT)
+async def forgot_password(request: Request, background_tasks: BackgroundTasks):
     """Initiate password reset process"""
     try:
-        data = request.get_json()
+        data = await get_json(request)
         
         if not data or not data.get('email'):
-            return jsonify({'error': 'Email is required'}), 400
+            return json_response({'error': 'Email is required'}, 400)
         
-        email = data['email'].lower().strip()
+        if inputs_too_long(data['email']):
+            return json_response({'error': 'Input too long'}, 400)
         
-        # Find user by email
-        user = User.query.filter_by(email=email).first()
+        email = normalize_email(data['email'])
         
-        if user:
-            # Generate reset token
-            reset_token = user.generate_reset_token()
-            db.session.commit()
-            
-            # Send reset email
-            if send_reset_email(user.email, reset_token):
-                return jsonify({'message': 'Password reset email sent'}), 200
-            else:
-                return jsonify({'error': 'Failed to send reset email'}), 500
-        
-        # Always return success to prevent email enumeration
-        return jsonify({'message': 'If the email exists, a reset link has been sent'}), 200
+        # Lookup, token write and SMTP all happen after the response, so the
+        # reply is identical in content and timing whether or not the email exists
+        queue_password_reset(background_tasks, email)
+        return json_response({'message': 'If the email exists, a reset link has been sent'}, 200)
         
     except Exception as e:
-        db.session.rollback()
-        return jsonify({'error': 'Internal server error'}), 500
+        return json_response({'error': 'Internal server error'}, 500)
 
-@app.route('/auth/reset-password', methods=['POST'])
-def reset_password():
+@app.post('/auth/reset-password')
+@limiter.limit(AUTH_RATE_LIMIT)
+async def reset_password(request: Request, db: AsyncSession = Depends(get_db)):
     """Reset password using reset token"""
     try:
-        data = request.get_json()
+        data = await get_json(request)
         
         if not data or not data.get('token') or not data.get('password'):
-            return jsonify({'error': 'Token and new password are required'}), 400
+            return json_response({'error': 'Token and new password are required'}, 400)
         
         reset_token = data['token']
         new_password = data['password']
         
+        if inputs_too_long(passwords=(new_password,)):
+            return json_response({'error': 'Input too long'}, 400)
+        
         # Find user by reset token
-        user = User.query.filter_by(reset_token=reset_token).first()
+        result = await db.execute(
+            select(User).where(User.reset_token_hash == _hash_reset_token(reset_token))
+        )
+        user = result.scalar_one_or_none()
         
         if not user:
-            return jsonify({'error': 'Invalid or expired reset token'}), 400
+            return json_response({'error': 'Invalid or expired reset token'}, 400)
         
         # Check if token has expired
         if user.reset_token_expires < datetime.datetime.utcnow():
-            return jsonify({'error': 'Reset token has expired'}), 400
+            return json_response({'error': 'Reset token has expired'}, 400)
         
         # Validate new password strength
         is_strong, message = validate_password_strength(new_password)
         if not is_strong:
-            return jsonify({'error': message}), 400
+            return json_response({'error': message}, 400)
         
         # Update password and clear reset token
-        user.set_password(new_password)
-        user.reset_token = None
+        await run_in_threadpool(user.set_password, new_password)
+        user.reset_token_hash = None
         user.reset_token_expires = None
         
-        db.session.commit()
+        await db.commit()
         
-        return jsonify({'message': 'Password reset successfully'}), 200
+        return json_response({'message': 'Password reset successfully'}, 200)
         
     except Exception as e:
-        db.session.rollback()
-        return jsonify({'error': 'Internal server error'}), 500
+        await db.rollback()
+        return json_response({'error': 'Internal server error'}, 500)
 
-@app.route('/auth/change-password', methods=['POST'])
-@token_required
-def change_password(current_user):
+@app.post('/auth/change-password')
+async def change_password(request: Request, current_user: User = Depends(get_current_user),
+                          db: AsyncSession = Depends(get_db)):
     """Change password for authenticated user"""
     try:
-        data = request.get_json()
+        data = await get_json(request)
         
         if not data or not data.get('current_password') or not data.get('new_password'):
-            return jsonify({'error': 'Current password and new password are required'}), 400
+            return json_response({'error': 'Current password and new password are required'}, 400)
         
         current_password = data['current_password']
         new_password = data['new_password']
         
-        # Verify current password
-        if not current_user.check_password(current_password):
-            return jsonify({'error': 'Current password is incorrect'}), 400
+        if inputs_too_long(passwords=(current_password, new_password)):
+            return json_response({'error': 'Input too long'}, 400)
+        
+        # Cheap checks first: rejected requests never pay for a hash
+        if new_password == current_password:
+            return json_response({'error': 'New password must differ'}, 400)
         
         # Validate new password strength
         is_strong, message = validate_password_strength(new_password)
         if not is_strong:
-            return jsonify({'error': message}), 400
+            return json_response({'error': message}, 400)
+        
+        # Verify current password
+        if not await run_in_threadpool(current_user.check_password, current_password):
+            return json_response({'error': 'Current password is incorrect'}, 400)
         
         # Update password
-        current_user.set_password(new_password)
-        db.session.commit()
+        await run_in_threadpool(current_user.set_password, new_password)
+        await db.commit()
         
-        return jsonify({'message': 'Password changed successfully'}), 200
+        return json_response({'message': 'Password changed successfully'}, 200)
         
     except Exception as e:
-        db.session.rollback()
-        return jsonify({'error': 'Internal server error'}), 500
+        await db.rollback()
+        return json_response({'error': 'Internal server error'}, 500)
 
 # Protected route example
-@app.route('/auth/profile', methods=['GET'])
-@token_required
-def get_profile(current_user):
+@app.get('/auth/profile')
+async def get_profile(current_user: User = Depends(get_current_user)):
     """Get user profile (protected route example)"""
-    return jsonify({
+    return json_response({
         'user': current_user.to_dict()
-    }), 200
+    }, 200)
 
 # Health check endpoint
-@app.route('/health', methods=['GET'])
-def health_check():
+@app.get('/health')
+async def health_check():
     """Health check endpoint"""
-    return jsonify({'status': 'healthy', 'timestamp': datetime.datetime.utcnow().isoformat()}), 200
-
-# Initialize database
-with app.app_context():
-    db.create_all()
+    global _health_timestamp
+    now = int(time.time())
+    if _health_timestamp[0] != now:
+        _health_timestamp = (now, datetime.datetime.utcfromtimestamp(now).isoformat())
+    return json_response({'status': 'healthy', 'timestamp': _health_timestamp[1]}, 200)
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
+    import uvicorn
+    uvicorn.run(app, port=5000)
 ```
 
 ```javascript